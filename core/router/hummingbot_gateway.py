@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 from typing import Any
@@ -7,6 +8,7 @@ from dotmap import DotMap
 
 from core.properties import properties
 from core.types import HttpMethod
+from hummingbot.constants import REQUEST_TIMEOUT
 
 
 async def hummingbot_gateway_router(
@@ -74,7 +76,12 @@ async def hummingbot_gateway_router(
 		"verify": certificates.certificate_authority_certificate
 	}
 
-	response = getattr(requests, method.value)(**request)
+	if method == HttpMethod.GET:
+		# Reads run off the event loop. The requests timeout, shorter than the retry timeout, keeps a hung socket from holding an executor thread.
+		response = await asyncio.to_thread(requests.get, **request, timeout=REQUEST_TIMEOUT)
+	else:
+		# Mutating calls stay blocking, so a retry timeout can never abandon a request that is still in flight and send it again.
+		response = getattr(requests, method.value)(**request)
 
 	try:
 		result = DotMap(response.json(), _dynamic=False)
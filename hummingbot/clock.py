@@ -74,6 +74,10 @@ class Clock(object):
 	def now() -> float:
 		return time.time()
 
+	@staticmethod
+	def now_in_nanoseconds() -> int:
+		return time.time_ns()
+
 	def clear(self):
 		self._events.clear()
 		self._has_new_events.clear()
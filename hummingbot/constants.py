@@ -10,6 +10,7 @@ DECIMAL_ZERO = Decimal(0)
 DECIMAL_INFINITY = Decimal("Infinity")
 DECIMAL_NAN = Decimal('NaN')
 DEFAULT_PRECISION = 9
+NANOSECONDS_IN_A_SECOND = 1_000_000_000
 
 KUJIRA_NATIVE_TOKEN = DotMap({
 	"id": "ukuji",
@@ -21,6 +22,7 @@ KUJIRA_NATIVE_TOKEN = DotMap({
 NUMBER_OF_RETRIES = 3
 DELAY_BETWEEN_RETRIES = 3
 TIMEOUT = 60
+REQUEST_TIMEOUT = 50
 
 VWAP_THRESHOLD = 50
 alignment_column = 12
@@ -1,13 +1,15 @@
 import asyncio
-import copy
 import json
 import os
 import textwrap
 import traceback
-from array import array
+from bisect import bisect_left
+from collections import defaultdict
 from decimal import Decimal, DecimalException
+from itertools import accumulate
 from logging import DEBUG, INFO, WARNING, CRITICAL
-from typing import Any, List, Optional
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import yaml
 from dotmap import DotMap
@@ -17,12 +19,99 @@ from core.properties import properties
 from core.types import SystemStatus
 from core.utils import dump, deep_merge
 from hummingbot.constants import DECIMAL_NAN, DEFAULT_PRECISION, alignment_column, DECIMAL_INFINITY
-from hummingbot.constants import KUJIRA_NATIVE_TOKEN, DECIMAL_ZERO, FLOAT_ZERO, FLOAT_INFINITY
+from hummingbot.constants import KUJIRA_NATIVE_TOKEN, DECIMAL_ZERO
 from hummingbot.hummingbot_gateway import HummingbotGateway
 from hummingbot.strategies.worker_base import WorkerBase
 from hummingbot.types import OrderStatus, OrderType, OrderSide, PriceStrategy, MiddlePriceStrategy, Order
-from hummingbot.utils import calculate_middle_price, format_currency, format_lines, format_line, format_percentage, \
-	parse_order_book
+from hummingbot.utils import calculate_middle_price, format_currency, format_lines, format_percentage, \
+	parse_order_book, cached_decimal, format_line_template
+
+
+SUMMARY_TEMPLATE = textwrap.dedent(
+	f"""\n\n\
+		<b>Worker</b>
+		 Id: {{client_id}}
+		 Network: {{network}}
+		 Market: <b>{{market_name}}</b>
+		 Wallet: ...{{wallet_address_suffix}}
+
+		<b>PnL (in USD)</b>:
+		{format_line_template(" <b>%</b>: ", "pnl_percentage", None, alignment_column + 6)}
+		{format_line_template(" <b>$</b>: ", "pnl_usd", ",.4f", alignment_column + 7)}
+		
+		<b>Balances (in USD)</b>:
+		 <b>Total</b>:
+		{format_line_template("  Free:", "total_free", ",.4f")}
+		{format_line_template("  Orders:", "total_locked_in_orders", ",.4f")}
+		{format_line_template("  Unsettled:", "total_unsettled", ",.4f")}
+		{format_line_template("  Total:", "total_total", ",.4f")}
+		 <b>Tokens</b>:
+		  <b>{{base_token_symbol}}</b>:
+		{format_line_template("   Price:", "base_quotation", ",.4f")}
+		{format_line_template("   Free:", "base_free", ",.4f")}
+		{format_line_template("   Sell Orders:", "base_locked_in_orders", ",.4f")}
+		{format_line_template("   Unsettled:", "base_unsettled", ",.4f")}
+		{format_line_template("   Total:", "base_total", ",.4f")}
+		  <b>{{quote_token_symbol}}</b>:
+		{format_line_template("   Price:", "quote_quotation", ",.4f")}
+		{format_line_template("   Free:", "quote_free", ",.4f")}
+		{format_line_template("   Buy Orders:", "quote_locked_in_orders", ",.4f")}
+		{format_line_template("   Unsettled:", "quote_unsettled", ",.4f")}
+		{format_line_template("   Total:", "quote_total", ",.4f")}
+		
+		<b>Wallet (in USD)</b>:
+		{format_line_template(" Wo:", "wallet_initial_value", ",.4f")}
+		{format_line_template(" Wp:", "wallet_previous_value", ",.4f")}
+		{format_line_template(" Wc:", "wallet_current_value", ",.4f")}
+		{format_line_template(" Wc/Wo:", "wallet_current_initial_pnl", None, alignment_column - 1)}
+		{format_line_template(" Wc/Wp:", "wallet_current_previous_pnl", None, alignment_column - 1)}
+		
+		<b>{{base_token_symbol}} (in {{quote_token_symbol}})</b>:
+		{format_line_template(" Bo:", "base_initial_price", ",.4f")}
+		{format_line_template(" Bp:", "base_previous_price", ",.4f")}
+		{format_line_template(" Bc:", "base_current_price", ",.4f")}
+		{format_line_template(" Bc/Bo:", "base_current_initial_pnl", None, alignment_column - 1)}
+		{format_line_template(" Bc/Bp:", "base_current_previous_pnl", None, alignment_column - 1)}
+		
+		<b>Price</b>:
+		{format_line_template(" Used:", "used_price", ",.4f")}
+		{format_line_template(" Ticker:", "ticker_price", ",.4f")}
+		
+		<b>Orders</b>:
+		 <b>Quantity</b>:
+		{format_line_template("  New:", "new_orders_quantity", None, alignment_column - 5)}
+		{format_line_template("  Canceled:", "canceled_orders_quantity", None, alignment_column - 5)}
+		
+		<b>Fees</b>:
+		{format_line_template(" Native Token:", "native_token_symbol")}
+		 <b>{{native_token_symbol}}</b>:
+		{format_line_template("  Create:", "token_creation", ",.5f")}
+		{format_line_template("  Cancel:", "token_cancellation", ",.5f")}
+		<code>  Withdraw:</code>
+		{format_line_template("   Native:", "token_withdrawing_native", ",.5f")}
+		{format_line_template("   Base:", "token_withdrawing_base", ",.5f")}
+		{format_line_template("   Quote:", "token_withdrawing_quote", ",.5f")}
+		{format_line_template("  Total:", "token_total", ",.5f")}
+		 <b>USD (~)</b>:
+		{format_line_template("  Create:", "usd_creation", ",.5f")}
+		{format_line_template("  Cancel:", "usd_cancellation", ",.5f")}
+		<code>  Withdraw:</code>
+		{format_line_template("   Base:", "usd_withdrawing_base", ",.5f")}
+		{format_line_template("   Quote:", "usd_withdrawing_quote", ",.5f")}
+		{format_line_template("   Total:", "usd_withdrawing_total", ",.5f")}
+		{format_line_template("  Total:", "usd_total", ",.5f")}\
+	"""
+)
+
+SETTINGS_SUMMARY_TEMPLATE = textwrap.dedent(
+	"""\n\n\
+		<b>Settings</b>:
+		 TickInterval: {tick_interval}
+		 OrderType: {order_type}
+		 PriceStrategy: {price_strategy}
+		 MiddlePriceStrategy: {middle_price_strategy}\
+	"""
+)
 
 
 @log_class_exceptions
@@ -35,6 +124,12 @@ class Worker(WorkerBase):
 			self._client_id = client_id
 
 			self._configuration: DotMap[str, Any]
+			self._price_strategy: PriceStrategy
+			self._middle_price_strategy: MiddlePriceStrategy
+			self._order_type: OrderType
+			self._order_type_value: str
+			self._layers: List[Tuple[Tuple[Any, ...], Tuple[Any, ...]]] = []
+			self._layers_source: Optional[List[Any]] = None
 			self._database_path: str
 			self._reload_configuration()
 
@@ -45,21 +140,28 @@ class Worker(WorkerBase):
 			super().__init__()
 
 			self._can_run: bool = True
-			self._is_busy: bool = False
 			self._initialized = False
 			self._first_time = True
 			self._refresh_timestamp: int = 0
 			self._wallet_address = None
 			self._market: DotMap[str, Any]
 			self._market_name = None
+			self._minimum_price_increment: Decimal
+			self._minimum_order_size: Decimal
 			self._base_token: DotMap[str, Any]
 			self._quote_token: DotMap[str, Any]
 			self._quote_token_name = None
 			self._base_token_name = None
+			self._base_request: Dict[str, Any]
+			self._market_request: Dict[str, Any]
+			self._owner_market_request: Dict[str, Any]
+			self._balances_request: Dict[str, Any]
+			self._open_orders_request: Dict[str, Any]
+			self._filled_orders_request: Dict[str, Any]
 			self._tickers: DotMap[str, Any]
 			self._balances: DotMap[str, Any] = DotMap({}, _dynamic=False)
-			self._all_tracked_orders_ids: [str] = []
-			self._currently_tracked_orders_ids: [str] = []
+			self._all_tracked_orders_ids: Set[str] = set()
+			self._currently_tracked_orders_ids: Set[str] = set()
 			self._open_orders: DotMap[str, Any]
 			self._filled_orders: DotMap[str, Any]
 
@@ -76,10 +178,6 @@ class Worker(WorkerBase):
 				"orders": None,
 				"balances": None,
 			}, _dynamic=False)
-
-			self._events: DotMap[str, asyncio.Event] = DotMap({
-				"on_tick": None,
-			}, _dynamic=False)
 		finally:
 			self.log(INFO, "end")
 
@@ -93,22 +191,50 @@ class Worker(WorkerBase):
 
 		with open(os.path.join(base_path, "common.yml"), 'r') as stream:
 			target = yaml.safe_load(stream) or {}
-			configuration = deep_merge(copy.deepcopy(configuration), target)
+			configuration = deep_merge(configuration, target)
 
 		with open(os.path.join(base_path, "workers", "common.yml"), 'r') as stream:
 			target = yaml.safe_load(stream) or {}
-			configuration = deep_merge(copy.deepcopy(configuration), target)
+			configuration = deep_merge(configuration, target)
 
 		with open(os.path.join(base_path, "workers", f"{self._client_id}.yml"), 'r') as stream:
 			target = yaml.safe_load(stream) or {}
-			configuration = deep_merge(copy.deepcopy(configuration), target)
+			configuration = deep_merge(configuration, target)
 
 		self._configuration = DotMap(configuration, _dynamic=False)
 
+		self._price_strategy = PriceStrategy[self._configuration.strategy.get("price_strategy", PriceStrategy.TICKER.name)]
+		self._middle_price_strategy = MiddlePriceStrategy[
+			self._configuration.strategy.get("middle_price_strategy", MiddlePriceStrategy.SAP.name)
+		]
+		self._order_type = OrderType[self._configuration.strategy.get("order_type", OrderType.LIMIT.name)]
+		self._order_type_value = self._order_type.value[0]
+
+		layers = configuration.get("strategy", {}).get("layers", [])
+		if layers != self._layers_source:
+			self._layers = self._parse_layers(self._configuration.strategy.layers)
+			self._layers_source = layers
+
 		self._database_path = os.path.join(root_path, "resources", "databases", self._parent.ID, self._parent.VERSION, "workers", f"{self._client_id}.json")
 
 		self.log(INFO, "end")
 
+	@staticmethod
+	def _parse_layers(layers: List[DotMap[str, Any]]) -> List[Tuple[Tuple[Any, ...], Tuple[Any, ...]]]:
+		def parse_decimal(value: Any) -> Optional[Decimal]:
+			return Decimal(value) if value else None
+
+		def parse_side(side: DotMap[str, Any]) -> Tuple[Any, ...]:
+			return (
+				int(side.quantity),
+				parse_decimal(side.spread.absolute),
+				parse_decimal(side.spread.percentage),
+				parse_decimal(side.budget.absolute),
+				parse_decimal(side.budget.percentage),
+			)
+
+		return [(parse_side(layer.bid), parse_side(layer.ask)) for layer in layers]
+
 	async def initialize(self):
 		try:
 			self.log(INFO, "start")
@@ -122,14 +248,45 @@ class Worker(WorkerBase):
 
 			self._wallet_address = self._configuration.wallet
 
+			self._base_request = {
+				"chain": self._configuration.chain,
+				"network": self._configuration.network,
+				"connector": self._configuration.connector,
+			}
+
 			self._market = await self._get_market()
 
+			self._minimum_price_increment = Decimal(self._market.minimumPriceIncrement)
+			self._minimum_order_size = Decimal(self._market.minimumOrderSize)
+
 			self._base_token = self._market.baseToken
 			self._quote_token = self._market.quoteToken
 
 			self._base_token_name = self._market.baseToken.name
 			self._quote_token_name = self._market.quoteToken.name
 
+			self._market_request = {
+				**self._base_request,
+				"marketId": self._market.id,
+			}
+			self._owner_market_request = {
+				**self._market_request,
+				"ownerAddress": self._wallet_address,
+			}
+			self._balances_request = {
+				**self._base_request,
+				"ownerAddress": self._wallet_address,
+				"tokenIds": [KUJIRA_NATIVE_TOKEN.id, self._base_token.id, self._quote_token.id]
+			}
+			self._open_orders_request = {
+				**self._owner_market_request,
+				"statuses": [OrderStatus.OPEN.value[0], OrderStatus.PARTIALLY_FILLED.value[0]]
+			}
+			self._filled_orders_request = {
+				**self._owner_market_request,
+				"status": OrderStatus.FILLED.value[0]
+			}
+
 			if self._configuration.strategy.withdraw_market_on_start:
 				try:
 					await self._market_withdraw()
@@ -146,9 +303,7 @@ class Worker(WorkerBase):
 
 			await self._get_balances(use_cache=False)
 
-			self.clock.start()
 			self._refresh_timestamp = self.clock.now()
-			(self._refresh_timestamp, self._events.on_tick) = self.clock.register(self._refresh_timestamp)
 
 			self._initialized = True
 			self._can_run = True
@@ -213,14 +368,16 @@ class Worker(WorkerBase):
 
 			while self._can_run:
 				try:
-					self.log(INFO, "loop - waiting")
+					delay = self._refresh_timestamp - self.clock.now()
+					if delay > 0:
+						self.log(INFO, f"loop - sleeping for {delay}...")
+						await asyncio.sleep(delay)
+						self.log(INFO, "loop - awaken")
 
-					await self._events.on_tick.wait()
+						continue
 
 					self.log(INFO, "loop - start")
 
-					self._is_busy = True
-
 					self._reload_configuration()
 
 					self.state.orders.new = DotMap({}, _dynamic=False)
@@ -228,8 +385,10 @@ class Worker(WorkerBase):
 					self.state.orders.canceled = DotMap({}, _dynamic=False)
 					self.state.orders.filled = DotMap({}, _dynamic=False)
 
-					await self._get_balances(use_cache=False)
-					await self._get_market_price(use_cache=False)
+					await asyncio.gather(
+						self._get_balances(use_cache=False),
+						self._get_market_price(use_cache=False)
+					)
 
 					await self._should_stop_loss()
 
@@ -247,34 +406,26 @@ class Worker(WorkerBase):
 					await self._get_balances(use_cache=False)
 					adjusted_orders_to_create = await self._adjust_proposal_to_budget(refined_proposal.solution.orders.create)
 					await self._place_orders(adjusted_orders_to_create)
-					self._currently_tracked_orders_ids.extend(list(refined_proposal.solution.meta.keep.keys()))
+					self._currently_tracked_orders_ids.update(refined_proposal.solution.meta.keep.keys())
 					await asyncio.sleep(self._configuration.strategy.sleep_time_after_orders_creation)
 
-					current_open_orders = await self._get_open_orders(use_cache=False)
+					(current_open_orders, _) = await asyncio.gather(
+						self._get_open_orders(use_cache=False),
+						self._get_balances(use_cache=False)
+					)
 					self.state.orders.untracked = self._get_untracked_orders(current_open_orders)
-
-					await self._get_balances(use_cache=False)
 					self.state.balances = self._balances
 
 					self._print_summary_and_save_state()
 
 					self._first_time = False
 
-					waiting_time = self._calculate_waiting_time(self._configuration.strategy.tick_interval)
-
-					self._refresh_timestamp = waiting_time + self.clock.now()
-					(self._refresh_timestamp, self._events.on_tick) = self.clock.register(self._refresh_timestamp)
+					self._refresh_timestamp = self._calculate_next_refresh_timestamp(self._configuration.strategy.tick_interval)
 
 					self.log(INFO, "loop - end")
 
 					if self._configuration.strategy.run_only_once:
 						await self.stop()
-
-					self._is_busy = False
-
-					self.log(INFO, f"loop - sleeping for {waiting_time}...")
-					await asyncio.sleep(waiting_time)
-					self.log(INFO, "loop - awaken")
 				except asyncio.exceptions.CancelledError:
 					return
 				except Exception as exception:
@@ -312,32 +463,33 @@ class Worker(WorkerBase):
 			self.log(INFO, "end")
 
 	async def _create_proposal(self) -> List[Order]:
+		order_book_task = asyncio.ensure_future(self._get_order_book())
+		ticker_price_task = asyncio.ensure_future(self._get_market_price(use_cache=False))
+		last_filled_order_price_task = asyncio.ensure_future(self._get_safe_last_filled_order_price())
+
 		try:
 			self.log(INFO, "start")
 
-			order_book = await self._get_order_book()
-			bids, asks = parse_order_book(order_book)
+			minimum_price_increment = self._minimum_price_increment
+			minimum_order_size = self._minimum_order_size
 
-			ticker_price = await self._get_market_price(use_cache=False)
-			self.state.price.ticker_price = ticker_price
+			# Only the VWAP middle price needs the full book, everything else uses just the best bid and ask.
+			if self._price_strategy == PriceStrategy.MIDDLE and self._middle_price_strategy == MiddlePriceStrategy.VWAP:
+				order_book_depth = None
+			else:
+				order_book_depth = 1
 
-			try:
-				last_filled_order_price = await self._get_last_filled_order_price()
-			except Exception as exception:
-				self.ignore_exception(exception)
+			bids, asks = parse_order_book(await order_book_task, order_book_depth)
 
-				last_filled_order_price = DECIMAL_ZERO
+			ticker_price = await ticker_price_task
+			self.state.price.ticker_price = ticker_price
 
+			last_filled_order_price = await last_filled_order_price_task
 			self.state.price.last_filled_order_price = last_filled_order_price
 
-			self._price_strategy = PriceStrategy[self._configuration.strategy.get("price_strategy", PriceStrategy.TICKER.name)]
 			if self._price_strategy == PriceStrategy.TICKER:
 				self._used_price = ticker_price
 			elif self._price_strategy == PriceStrategy.MIDDLE:
-				self._middle_price_strategy = MiddlePriceStrategy[
-					self._configuration.strategy.get("middle_price_strategy", MiddlePriceStrategy.SAP.name)
-				]
-
 				self._used_price = await self._get_market_middle_price(
 					bids,
 					asks,
@@ -353,121 +505,141 @@ class Worker(WorkerBase):
 
 			self.state.price.used_price = self._used_price
 
-			self._order_type = OrderType[self._configuration.strategy.get("order_type", OrderType.LIMIT.name)]
+			# An empty book side falls back to the used price, so no order is anchored to zero or infinity.
+			best_bid_price = Decimal(str(bids[0][0])) if bids else self._used_price
+			best_ask_price = Decimal(str(asks[0][0])) if asks else self._used_price
+
+			if self._configuration.strategy.be_the_first:
+				bid_base_price = min(best_bid_price, best_ask_price - minimum_price_increment)
+				ask_base_price = max(best_ask_price, best_bid_price + minimum_price_increment)
+			else:
+				bid_base_price = min(self._used_price, best_ask_price)
+				ask_base_price = max(self._used_price, best_bid_price)
 
-			minimum_price_increment = Decimal(self._market.minimumPriceIncrement)
-			minimum_order_size = Decimal(self._market.minimumOrderSize)
+			balances = await self._get_balances()
+			bid_quotation = balances.tokens[self._quote_token.id].inUSD.quotation
+			ask_quotation = balances.tokens[self._base_token.id].inUSD.quotation
 
-			best_bid_price = Decimal(next(iter(bids), {"price": FLOAT_ZERO}).price)
-			best_ask_price = Decimal(next(iter(asks), {"price": FLOAT_INFINITY}).price)
+			wallet_current_value = self.state.wallet.current_value
+			market_name = self._market_name
+			order_type = self._order_type
+			buy_side = OrderSide.BUY
+			sell_side = OrderSide.SELL
 
 			client_id = 1
-			proposal = []
-
 			bid_orders = []
-			for index, layer in enumerate(self._configuration.strategy.layers, start=1):
-				if self._configuration.strategy.be_the_first:
-					base_price = min(best_bid_price, best_ask_price - minimum_price_increment)
-				else:
-					base_price = min(self._used_price, best_ask_price)
-
-				quotation = (await self._get_balances()).tokens[self._quote_token.id].inUSD.quotation
-				bid_quantity = int(layer.bid.quantity)
+			ask_orders = []
 
-				if layer.bid.spread.absolute:
-					bid_price = max(base_price - Decimal(layer.bid.spread.absolute), minimum_price_increment)
-				elif layer.bid.spread.percentage:
-					bid_spread_percentage = Decimal(layer.bid.spread.percentage)
-					bid_price = ((100 - bid_spread_percentage) / 100) * base_price
+			for index, (bid, ask) in enumerate(self._layers, start=1):
+				(
+					bid_quantity,
+					bid_spread_absolute,
+					bid_spread_percentage,
+					bid_budget_absolute,
+					bid_budget_percentage
+				) = bid
+
+				if bid_spread_absolute:
+					bid_price = max(bid_base_price - bid_spread_absolute, minimum_price_increment)
+				elif bid_spread_percentage:
+					bid_price = ((100 - bid_spread_percentage) / 100) * bid_base_price
 				else:
 					raise ValueError(f"Invalid spread in layer {index}.")
 
-				if layer.bid.budget.absolute:
-					bid_budget = Decimal(layer.bid.budget.absolute)
-				elif layer.bid.budget.percentage:
-					bid_budget = (Decimal(layer.bid.budget.percentage) / 100) * self.state.wallet.current_value
+				if bid_budget_absolute:
+					bid_budget = bid_budget_absolute
+				elif bid_budget_percentage:
+					bid_budget = (bid_budget_percentage / 100) * wallet_current_value
 				else:
 					raise ValueError(f"Invalid budget in layer {index}.")
 
-				bid_size = self.safe_division(self.safe_division(bid_budget, quotation), bid_quantity)
+				bid_size = self.safe_division(self.safe_division(bid_budget, bid_quotation), bid_quantity)
 
 				if bid_size.is_nan() or (not (bid_size > 0)):
-					continue
-
-				if bid_price < minimum_price_increment:
+					pass
+				elif not bid_price.is_finite():
+					self.log(WARNING, f"""Skipping orders placement from layer {index}, invalid bid price:\n\n{'{:^30}'.format(str(bid_price))}""")
+				elif bid_price < minimum_price_increment:
 					self.log(WARNING, f"""Skipping orders placement from layer {index}, bid price too low:\n\n{'{:^30}'.format(round(bid_price, 6))}""")
 				elif bid_size < minimum_order_size:
 					self.log(WARNING, f"""Skipping orders placement from layer {index}, bid size too low:\n\n{'{:^30}'.format(round(bid_size, 9))}""")
 				else:
 					for i in range(bid_quantity):
-						bid_order = Order()
-						bid_order.id = str(client_id)  # This is a temporary id
-						bid_order.client_id = str(client_id)
-						bid_order.market_name = self._market_name
-						bid_order.type = self._order_type
-						bid_order.side = OrderSide.BUY
-						bid_order.amount = bid_size
-						bid_order.price = bid_price
-
-						bid_orders.append(bid_order)
+						order_client_id = str(client_id)
+
+						bid_orders.append(Order(
+							id=order_client_id,  # This is a temporary id
+							client_id=order_client_id,
+							market_name=market_name,
+							type=order_type,
+							side=buy_side,
+							amount=bid_size,
+							price=bid_price,
+						))
 
 						client_id += 1
 
-			ask_orders = []
-			for index, layer in enumerate(self._configuration.strategy.layers, start=1):
-				if self._configuration.strategy.be_the_first:
-					base_price = max(best_ask_price, best_bid_price + minimum_price_increment)
-				else:
-					base_price = max(self._used_price, best_bid_price)
-
-				quotation = (await self._get_balances()).tokens[self._base_token.id].inUSD.quotation
-				ask_quantity = int(layer.ask.quantity)
-
-				if layer.ask.spread.absolute:
-					ask_price = min(base_price + Decimal(layer.ask.spread.absolute), DECIMAL_INFINITY)
-				elif layer.ask.spread.percentage:
-					ask_spread_percentage = Decimal(layer.ask.spread.percentage)
-					ask_price = ((100 + ask_spread_percentage) / 100) * base_price
+				(
+					ask_quantity,
+					ask_spread_absolute,
+					ask_spread_percentage,
+					ask_budget_absolute,
+					ask_budget_percentage
+				) = ask
+
+				if ask_spread_absolute:
+					ask_price = min(ask_base_price + ask_spread_absolute, DECIMAL_INFINITY)
+				elif ask_spread_percentage:
+					ask_price = ((100 + ask_spread_percentage) / 100) * ask_base_price
 				else:
 					raise ValueError(f"Invalid spread in layer {index}.")
 
-				if layer.ask.budget.absolute:
-					ask_budget = Decimal(layer.ask.budget.absolute)
-				elif layer.ask.budget.percentage:
-					ask_budget = (Decimal(layer.ask.budget.percentage) / 100) * self.state.wallet.current_value
+				if ask_budget_absolute:
+					ask_budget = ask_budget_absolute
+				elif ask_budget_percentage:
+					ask_budget = (ask_budget_percentage / 100) * wallet_current_value
 				else:
 					raise ValueError(f"Invalid budget in layer {index}.")
 
-				ask_size = self.safe_division(self.safe_division(ask_budget, quotation), ask_quantity)
+				ask_size = self.safe_division(self.safe_division(ask_budget, ask_quotation), ask_quantity)
 
 				if ask_size.is_nan() or (not (ask_size > 0)):
-					continue
-
-				if ask_price < minimum_price_increment:
+					pass
+				elif not ask_price.is_finite():
+					self.log(WARNING, f"""Skipping orders placement from layer {index}, invalid ask price:\n\n{'{:^30}'.format(str(ask_price))}""")
+				elif ask_price < minimum_price_increment:
 					self.log(WARNING, f"""Skipping orders placement from layer {index}, ask price too low:\n\n{'{:^30}'.format(round(ask_price, 9))}""", True)
 				elif ask_size < minimum_order_size:
 					self.log(WARNING, f"""Skipping orders placement from layer {index}, ask size too low:\n\n{'{:^30}'.format(round(ask_size, 9))}""", True)
 				else:
 					for i in range(ask_quantity):
-						ask_order = Order()
-						ask_order.id = str(client_id)  # This is a temporary id
-						ask_order.client_id = str(client_id)
-						ask_order.market_name = self._market_name
-						ask_order.type = self._order_type
-						ask_order.side = OrderSide.SELL
-						ask_order.amount = ask_size
-						ask_order.price = ask_price
-
-						ask_orders.append(ask_order)
+						order_client_id = str(client_id)
+
+						ask_orders.append(Order(
+							id=order_client_id,  # This is a temporary id
+							client_id=order_client_id,
+							market_name=market_name,
+							type=order_type,
+							side=sell_side,
+							amount=ask_size,
+							price=ask_price,
+						))
 
 						client_id += 1
 
-			proposal = [*proposal, *bid_orders, *ask_orders]
+			proposal = [*bid_orders, *ask_orders]
 
 			self.log(DEBUG, f"""proposal:\n{dump(proposal)}""")
 
 			return proposal
 		finally:
+			for task in (order_book_task, ticker_price_task, last_filled_order_price_task):
+				if not task.done():
+					task.cancel()
+				elif not task.cancelled():
+					# Retrieves the failure of a task that was never awaited because an earlier await raised.
+					task.exception()
+
 			self.log(INFO, "end")
 
 	async def _refine_proposal(self, current_orders: List[Order], proposed_orders: List[Order]) -> DotMap[str, Any]:
@@ -479,14 +651,17 @@ class Worker(WorkerBase):
 			proposed_orders_buy = []
 			proposed_orders_sell = []
 
+			buy_side = OrderSide.BUY
+			buy_side_name = buy_side.name
+
 			for order in current_orders.values():
-				if order.side == OrderSide.BUY.name:
+				if order.side == buy_side_name:
 					current_orders_buy.append(order)
 				else:
 					current_orders_sell.append(order)
 
 			for order in proposed_orders:
-				if order.side == OrderSide.BUY:
+				if order.side == buy_side:
 					proposed_orders_buy.append(order)
 				else:
 					proposed_orders_sell.append(order)
@@ -612,30 +787,45 @@ class Worker(WorkerBase):
 		try:
 			self.log(INFO, "start")
 
-			adjusted_proposal: List[Order] = []
+			def fit_to_balance(orders: List[Order], balance: Decimal) -> List[Order]:
+				# Every order of the prefix whose running total stays below the balance fits.
+				cumulative_amounts = list(accumulate(order.amount for order in orders))
+				cutoff = bisect_left(cumulative_amounts, balance)
 
-			balances = await self._get_balances()
-			base_balance = Decimal(balances.tokens[self._base_token.id].free)
-			quote_balance = Decimal(balances.tokens[self._quote_token.id].free)
-			current_base_balance = base_balance
-			current_quote_balance = quote_balance
+				selected = orders[:cutoff]
+				remaining_balance = balance - (cumulative_amounts[cutoff - 1] if cutoff else DECIMAL_ZERO)
+
+				# Smaller orders after the first one that does not fit may still fit.
+				for order in orders[cutoff + 1:]:
+					if remaining_balance > order.amount:
+						remaining_balance -= order.amount
+						selected.append(order)
+
+				return selected
+
+			bid_orders: List[Order] = []
+			ask_orders: List[Order] = []
+
+			buy_side = OrderSide.BUY
+			sell_side = OrderSide.SELL
 
 			for order in candidate_proposal:
-				if order.side == OrderSide.BUY:
-					if current_quote_balance > order.amount:
-						current_quote_balance -= order.amount
-						adjusted_proposal.append(order)
-					else:
-						continue
-				elif order.side == OrderSide.SELL:
-					if current_base_balance > order.amount:
-						current_base_balance -= order.amount
-						adjusted_proposal.append(order)
-					else:
-						continue
+				if order.side == buy_side:
+					bid_orders.append(order)
+				elif order.side == sell_side:
+					ask_orders.append(order)
 				else:
 					raise ValueError(f"""Unrecognized order size "{order.side}".""")
 
+			balances = await self._get_balances()
+			base_balance = Decimal(balances.tokens[self._base_token.id].free)
+			quote_balance = Decimal(balances.tokens[self._quote_token.id].free)
+
+			adjusted_proposal: List[Order] = [
+				*fit_to_balance(bid_orders, quote_balance),
+				*fit_to_balance(ask_orders, base_balance)
+			]
+
 			self.log(DEBUG, f"""adjusted_proposal:\n{dump(adjusted_proposal)}""")
 
 			return adjusted_proposal
@@ -663,6 +853,14 @@ class Worker(WorkerBase):
 		finally:
 			self.log(INFO, "end")
 
+	async def _get_safe_last_filled_order_price(self) -> Decimal:
+		try:
+			return await self._get_last_filled_order_price()
+		except Exception as exception:
+			self.ignore_exception(exception)
+
+			return DECIMAL_ZERO
+
 	async def _get_market_price(self, use_cache: bool = True) -> Decimal:
 		return await self._get_base_ticker_price(use_cache=use_cache)
 
@@ -712,13 +910,7 @@ class Worker(WorkerBase):
 
 			response = None
 			try:
-				request = {
-					"chain": self._configuration.chain,
-					"network": self._configuration.network,
-					"connector": self._configuration.connector,
-					"ownerAddress": self._wallet_address,
-					"tokenIds": [KUJIRA_NATIVE_TOKEN.id, self._base_token.id, self._quote_token.id]
-				}
+				request = self._balances_request
 
 				self.log(DEBUG, f"""gateway.kujira_get_balances: request:\n{dump(request)}""")
 
@@ -727,24 +919,24 @@ class Worker(WorkerBase):
 				else:
 					response = await HummingbotGateway.kujira_get_balances(request)
 
-					self._balances = DotMap(copy.deepcopy(response), _dynamic=False)
+					self._balances = DotMap(response, _dynamic=False)
 
-					self._balances.total.free = Decimal(self._balances.total.free)
-					self._balances.total.lockedInOrders = Decimal(self._balances.total.lockedInOrders)
-					self._balances.total.unsettled = Decimal(self._balances.total.unsettled)
-					self._balances.total.total = Decimal(self._balances.total.total)
+					self._balances.total.free = cached_decimal(self._balances.total.free)
+					self._balances.total.lockedInOrders = cached_decimal(self._balances.total.lockedInOrders)
+					self._balances.total.unsettled = cached_decimal(self._balances.total.unsettled)
+					self._balances.total.total = cached_decimal(self._balances.total.total)
 
 					for (token, balance) in self._balances.tokens.items():
-						balance.free = Decimal(balance.free)
-						balance.lockedInOrders = Decimal(balance.lockedInOrders)
-						balance.unsettled = Decimal(balance.unsettled)
-						balance.total = Decimal(balance.total)
+						balance.free = cached_decimal(balance.free)
+						balance.lockedInOrders = cached_decimal(balance.lockedInOrders)
+						balance.unsettled = cached_decimal(balance.unsettled)
+						balance.total = cached_decimal(balance.total)
 
-						balance.inUSD.quotation = Decimal(balance.inUSD.quotation)
-						balance.inUSD.free = Decimal(balance.inUSD.free)
-						balance.inUSD.lockedInOrders = Decimal(balance.inUSD.lockedInOrders)
-						balance.inUSD.unsettled = Decimal(balance.inUSD.unsettled)
-						balance.inUSD.total = Decimal(balance.inUSD.total)
+						balance.inUSD.quotation = cached_decimal(balance.inUSD.quotation)
+						balance.inUSD.free = cached_decimal(balance.inUSD.free)
+						balance.inUSD.lockedInOrders = cached_decimal(balance.inUSD.lockedInOrders)
+						balance.inUSD.unsettled = cached_decimal(balance.inUSD.unsettled)
+						balance.inUSD.total = cached_decimal(balance.inUSD.total)
 
 				return self._balances
 			except Exception as exception:
@@ -764,9 +956,7 @@ class Worker(WorkerBase):
 			response = None
 			try:
 				request = {
-					"chain": self._configuration.chain,
-					"network": self._configuration.network,
-					"connector": self._configuration.connector,
+					**self._base_request,
 					"name": self._market_name
 				}
 
@@ -791,12 +981,7 @@ class Worker(WorkerBase):
 			# request = None
 			response = None
 			try:
-				request = {
-					"chain": self._configuration.chain,
-					"network": self._configuration.network,
-					"connector": self._configuration.connector,
-					"marketId": self._market.id
-				}
+				request = self._market_request
 
 				self.log(DEBUG, f"""gateway.kujira_get_order_books: request:\n{dump(request)}""")
 
@@ -819,12 +1004,7 @@ class Worker(WorkerBase):
 			# request = None
 			response = None
 			try:
-				request = {
-					"chain": self._configuration.chain,
-					"network": self._configuration.network,
-					"connector": self._configuration.connector,
-					"marketId": self._market.id
-				}
+				request = self._market_request
 
 				self.log(DEBUG, f"""gateway.kujira_get_ticker: request:\n{dump(request)}""")
 
@@ -853,14 +1033,7 @@ class Worker(WorkerBase):
 			# request = None
 			response = None
 			try:
-				request = {
-					"chain": self._configuration.chain,
-					"network": self._configuration.network,
-					"connector": self._configuration.connector,
-					"marketId": self._market.id,
-					"ownerAddress": self._wallet_address,
-					"statuses": [OrderStatus.OPEN.value[0], OrderStatus.PARTIALLY_FILLED.value[0]]
-				}
+				request = self._open_orders_request
 
 				self.log(DEBUG, f"""gateway.kujira_get_open_orders: request:\n{dump(request)}""")
 
@@ -902,14 +1075,7 @@ class Worker(WorkerBase):
 			# request = None
 			response = None
 			try:
-				request = {
-					"chain": self._configuration.chain,
-					"network": self._configuration.network,
-					"connector": self._configuration.connector,
-					"marketId": self._market.id,
-					"ownerAddress": self._wallet_address,
-					"status": OrderStatus.FILLED.value[0]
-				}
+				request = self._filled_orders_request
 
 				self.log(DEBUG, f"""gateway.kujira_get_filled_orders: request:\n{dump(request)}""")
 
@@ -938,22 +1104,24 @@ class Worker(WorkerBase):
 
 			response = None
 			try:
+				market_id = self._market.id
+				wallet_address = self._wallet_address
+				order_type_value = self._order_type_value
+
 				orders = []
 				for candidate in proposal:
 					orders.append({
 						"clientId": candidate.client_id,
-						"marketId": self._market.id,
-						"ownerAddress": self._wallet_address,
+						"marketId": market_id,
+						"ownerAddress": wallet_address,
 						"side": candidate.side.value[0],
 						"price": str(candidate.price),
 						"amount": str(candidate.amount),
-						"type": self._order_type.value[0],
+						"type": order_type_value,
 					})
 
 				request = {
-					"chain": self._configuration.chain,
-					"network": self._configuration.network,
-					"connector": self._configuration.connector,
+					**self._base_request,
 					"orders": orders
 				}
 
@@ -962,8 +1130,8 @@ class Worker(WorkerBase):
 				if len(orders):
 					response = await HummingbotGateway.kujira_post_orders(request)
 
-					self._currently_tracked_orders_ids = list(response.keys())
-					self._all_tracked_orders_ids.extend(self._currently_tracked_orders_ids)
+					self._currently_tracked_orders_ids = set(response.keys())
+					self._all_tracked_orders_ids.update(self._currently_tracked_orders_ids)
 
 					if response:
 						if not self._balances:
@@ -1000,12 +1168,8 @@ class Worker(WorkerBase):
 
 				if len(target_orders_ids) > 0:
 					request = {
-						"chain": self._configuration.chain,
-						"network": self._configuration.network,
-						"connector": self._configuration.connector,
+						**self._owner_market_request,
 						"ids": target_orders_ids,
-						"marketId": self._market.id,
-						"ownerAddress": self._wallet_address,
 					}
 
 					self.log(DEBUG, f"""gateway.kujira_delete_orders: request:\n{dump(request)}""")
@@ -1037,13 +1201,7 @@ class Worker(WorkerBase):
 			# request = None
 			response = None
 			try:
-				request = {
-					"chain": self._configuration.chain,
-					"network": self._configuration.network,
-					"connector": self._configuration.connector,
-					"marketId": self._market.id,
-					"ownerAddress": self._wallet_address,
-				}
+				request = self._owner_market_request
 
 				self.log(DEBUG, f"""gateway.clob_delete_orders: request:\n{dump(request)}""")
 
@@ -1068,13 +1226,7 @@ class Worker(WorkerBase):
 
 			response = None
 			try:
-				request = {
-					"chain": self._configuration.chain,
-					"network": self._configuration.network,
-					"connector": self._configuration.connector,
-					"marketId": self._market.id,
-					"ownerAddress": self._wallet_address,
-				}
+				request = self._owner_market_request
 
 				self.log(DEBUG, f"""gateway.kujira_post_market_withdraw: request:\n{dump(request)}""")
 
@@ -1114,24 +1266,19 @@ class Worker(WorkerBase):
 		try:
 			open_orders = (await self._get_open_orders()).values()
 
-			open_orders_map = {}
+			open_orders_map = defaultdict(list)
 			duplicated_orders_ids = []
 
 			for open_order in open_orders:
 				if open_order.clientId == "0":  # Avoid touching manually created orders.
 					continue
-				elif open_order.clientId not in open_orders_map:
-					open_orders_map[open_order.clientId] = [open_order]
-				else:
-					open_orders_map[open_order.clientId].append(open_order)
+
+				open_orders_map[open_order.clientId].append(open_order)
 
 			for orders in open_orders_map.values():
 				orders.sort(key=lambda order: order.id)
 
-				duplicated_orders_ids = [
-					*duplicated_orders_ids,
-					*[order.id for order in orders[:-1]]
-				]
+				duplicated_orders_ids.extend(order.id for order in orders[:-1])
 
 			self.log(DEBUG, f"""duplicated_orders_ids:\n{dump(duplicated_orders_ids)}""")
 
@@ -1292,175 +1439,124 @@ class Worker(WorkerBase):
 
 	# noinspection DuplicatedCode
 	def _get_summary(self) -> str | None:
-		summary = ""
+		state = self.state
+		state_orders = state.orders
+		wallet = state.wallet
+		total_balances = state.balances.total
+		base_balances = state.balances.tokens[self._base_token.id].inUSD
+		quote_balances = state.balances.tokens[self._quote_token.id].inUSD
+		base_token_prices = state.token.base
+		prices = state.price
+		gas_payed = state.gas_payed
+		gas_payed_token_amounts = gas_payed.token_amounts
+		gas_payed_usd_amounts = gas_payed.usd_amounts
 
 		new_orders_summary = ""
 		untracked_orders_summary = ""
 		canceled_orders_summary = ""
 		filled_orders_summary = ""
 
-		if self.state.orders.new:
-			orders: List[DotMap[str, Any]] = list(self.state.orders.new.values())
-			orders.sort(key=lambda item: item.id)
-
-			groups: array[array[str]] = [[], [], [], [], [], [], [], []]
-			for order in orders:
-				groups[0].append(order.id)
-				groups[2].append(str(order.type).lower())
-				groups[1].append(str(order.side).lower())
-				groups[3].append(format_currency(Decimal(order.amount), 3))
-				groups[4].append(self._base_token.symbol)
-				groups[5].append("by")
-				groups[6].append(format_currency(Decimal(order.price), 3))
-				groups[7].append(self._quote_token.symbol)
-
-			new_orders_summary = format_lines(groups)
-
-		if self.state.orders.untracked:
-			orders: List[DotMap[str, Any]] = list(self.state.orders.untracked.values())
-			orders.sort(key=lambda item: item.id)
-
-			groups: array[array[str]] = [[], [], [], [], [], [], [], []]
-			for order in orders:
-				groups[0].append(order.id)
-				groups[2].append(str(order.type).lower())
-				groups[1].append(str(order.side).lower())
-				groups[3].append(format_currency(Decimal(order.amount), 3))
-				groups[4].append(self._base_token.symbol)
-				groups[5].append("by")
-				groups[6].append(format_currency(Decimal(order.price), 3))
-				groups[7].append(self._quote_token.symbol)
-
-			untracked_orders_summary = format_lines(groups)
-
-		if self.state.orders.canceled:
-			orders: List[DotMap[str, Any]] = list(self.state.orders.canceled.values())
-			# orders.sort(key=lambda item: item.price)
-
-			groups: array[array[str]] = [[]]
-			for order in orders:
-				groups[0].append(order.id)
-				# groups[1].append(str(order.type).lower())
-				# groups[2].append(order.marketName)
-
-			canceled_orders_summary = format_lines(groups)
-
-		if self.state.orders.filled:
-			orders: List[DotMap[str, Any]] = list(self.state.orders.filled.values())
-			orders.sort(key=lambda item: item.id)
-
-			groups: array[array[str]] = [[], [], [], [], [], [], [], []]
-			for order in orders:
-				groups[0].append(order.id)
-				groups[1].append(str(order.side).lower())
-				groups[2].append(str(order.type).lower())
-				groups[3].append(format_currency(Decimal(order.amount), 3))
-				groups[4].append(self._base_token.symbol)
-				groups[5].append("by")
-				groups[6].append(format_currency(Decimal(order.price), 3))
-				groups[7].append(self._quote_token.symbol)
-
-			filled_orders_summary = format_lines(groups)
-
-		summary += textwrap.dedent(
-			f"""\n\n\
-				<b>Worker</b>
-				 Id: {self._client_id}
-				 Network: {self._configuration.network}
-				 Market: <b>{self._market.name}</b>
-				 Wallet: ...{str(self._wallet_address)[-4:]}
-
-				<b>PnL (in USD)</b>:
-				{format_line(" <b>%</b>: ", format_percentage(self.state.wallet.current_initial_pnl, 3), alignment_column + 6)}
-				{format_line(" <b>$</b>: ", format_currency(self.state.wallet.current_initial_pnl_in_usd, 4), alignment_column + 7)}
-				
-				<b>Balances (in USD)</b>:
-				 <b>Total</b>:
-				{format_line(f"  Free:", format_currency(self.state.balances.total.free, 4))}
-				{format_line(f"  Orders:", format_currency(self.state.balances.total.lockedInOrders, 4))}
-				{format_line(f"  Unsettled:", format_currency(self.state.balances.total.unsettled, 4))}
-				{format_line(f"  Total:", format_currency(self.state.balances.total.total, 4))}
-				 <b>Tokens</b>:
-				  <b>{self._base_token.symbol}</b>:
-				{format_line(f"   Price:", format_currency(self.state.balances.tokens[self._base_token.id].inUSD.quotation, 4))}
-				{format_line(f"   Free:", format_currency(self.state.balances.tokens[self._base_token.id].inUSD.free, 4))}
-				{format_line(f"   Sell Orders:", format_currency(self.state.balances.tokens[self._base_token.id].inUSD.lockedInOrders, 4))}
-				{format_line(f"   Unsettled:", format_currency(self.state.balances.tokens[self._base_token.id].inUSD.unsettled, 4))}
-				{format_line(f"   Total:", format_currency(self.state.balances.tokens[self._base_token.id].inUSD.total, 4))}
-				  <b>{self._quote_token.symbol}</b>:
-				{format_line(f"   Price:", format_currency(self.state.balances.tokens[self._quote_token.id].inUSD.quotation, 4))}
-				{format_line(f"   Free:", format_currency(self.state.balances.tokens[self._quote_token.id].inUSD.free, 4))}
-				{format_line(f"   Buy Orders:", format_currency(self.state.balances.tokens[self._quote_token.id].inUSD.lockedInOrders, 4))}
-				{format_line(f"   Unsettled:", format_currency(self.state.balances.tokens[self._quote_token.id].inUSD.unsettled, 4))}
-				{format_line(f"   Total:", format_currency(self.state.balances.tokens[self._quote_token.id].inUSD.total, 4))}
-				
-				<b>Wallet (in USD)</b>:
-				{format_line(" Wo:", format_currency(self.state.wallet.initial_value, 4))}
-				{format_line(" Wp:", format_currency(self.state.wallet.previous_value, 4))}
-				{format_line(" Wc:", format_currency(self.state.wallet.current_value, 4))}
-				{format_line(" Wc/Wo:", (format_percentage(self.state.wallet.current_initial_pnl, 3)), alignment_column - 1)}
-				{format_line(" Wc/Wp:", format_percentage(self.state.wallet.current_previous_pnl, 3), alignment_column - 1)}
-				
-				<b>{self._base_token.symbol} (in {self._quote_token.symbol})</b>:
-				{format_line(" Bo:", format_currency(self.state.token.base.initial_price, 4))}
-				{format_line(" Bp:", format_currency(self.state.token.base.previous_price, 4))}
-				{format_line(" Bc:", format_currency(self.state.token.base.current_price, 4))}
-				{format_line(" Bc/Bo:", format_percentage(self.state.token.base.current_initial_pnl, 3), alignment_column - 1)}
-				{format_line(" Bc/Bp:", format_percentage(self.state.token.base.current_previous_pnl, 3), alignment_column - 1)}
-				
-				<b>Price</b>:
-				{format_line(" Used:", format_currency(self.state.price.used_price, 4))}
-				{format_line(" Ticker:", format_currency(self.state.price.ticker_price, 4))}
-				
-				<b>Orders</b>:
-				 <b>Quantity</b>:
-				{format_line("  New:", str(len(self.state.orders.new)), alignment_column - 5)}
-				{format_line("  Canceled:", str(len(self.state.orders.canceled)), alignment_column - 5)}
-				
-				<b>Fees</b>:
-				{format_line(" Native Token:", self.state.gas_payed.token.symbol)}
-				 <b>{self.state.gas_payed.token.symbol}</b>:
-				{format_line("  Create:", format_currency(self.state.gas_payed.token_amounts.creation, 5))}
-				{format_line("  Cancel:", format_currency(self.state.gas_payed.token_amounts.cancellation, 5))}
-				<code>  Withdraw:</code>
-				{format_line("   Native:", format_currency(self.state.gas_payed.token_amounts.withdrawing.native, 5))}
-				{format_line("   Base:", format_currency(self.state.gas_payed.token_amounts.withdrawing.base, 5))}
-				{format_line("   Quote:", format_currency(self.state.gas_payed.token_amounts.withdrawing.quote, 5))}
-				{format_line("  Total:", format_currency(self.state.gas_payed.token_amounts.total, 5))}
-				 <b>USD (~)</b>:
-				{format_line("  Create:", format_currency(self.state.gas_payed.usd_amounts.creation, 5))}
-				{format_line("  Cancel:", format_currency(self.state.gas_payed.usd_amounts.cancellation, 5))}
-				<code>  Withdraw:</code>
-				{format_line("   Base:", format_currency(self.state.gas_payed.usd_amounts.withdrawing.base, 5))}
-				{format_line("   Quote:", format_currency(self.state.gas_payed.usd_amounts.withdrawing.quote, 5))}
-				{format_line("   Total:", format_currency(self.state.gas_payed.usd_amounts.withdrawing.total, 5))}
-				{format_line("  Total:", format_currency(self.state.gas_payed.usd_amounts.total, 5))}\
-			"""
-		)
+		base_token_symbol = self._base_token.symbol
+		quote_token_symbol = self._quote_token.symbol
+
+		def format_orders(orders: List[DotMap[str, Any]]) -> str:
+			quantity = len(orders)
+
+			return format_lines([
+				[order.id for order in orders],
+				[str(order.side).lower() for order in orders],
+				[str(order.type).lower() for order in orders],
+				[format_currency(Decimal(order.amount), 3) for order in orders],
+				[base_token_symbol] * quantity,
+				["by"] * quantity,
+				[format_currency(Decimal(order.price), 3) for order in orders],
+				[quote_token_symbol] * quantity,
+			])
+
+		if state_orders.new:
+			new_orders_summary = format_orders(sorted(state_orders.new.values(), key=itemgetter("id")))
+
+		if state_orders.untracked:
+			untracked_orders_summary = format_orders(sorted(state_orders.untracked.values(), key=itemgetter("id")))
+
+		if state_orders.canceled:
+			canceled_orders_summary = format_lines([[order.id for order in state_orders.canceled.values()]])
+
+		if state_orders.filled:
+			filled_orders_summary = format_orders(sorted(state_orders.filled.values(), key=itemgetter("id")))
+
+		summary_parts: List[str] = [SUMMARY_TEMPLATE.format_map({
+			"client_id": self._client_id,
+			"network": self._configuration.network,
+			"market_name": self._market.name,
+			"wallet_address_suffix": str(self._wallet_address)[-4:],
+			"pnl_percentage": format_percentage(wallet.current_initial_pnl, 3),
+			"pnl_usd": wallet.current_initial_pnl_in_usd,
+			"total_free": total_balances.free,
+			"total_locked_in_orders": total_balances.lockedInOrders,
+			"total_unsettled": total_balances.unsettled,
+			"total_total": total_balances.total,
+			"base_token_symbol": self._base_token.symbol,
+			"base_quotation": base_balances.quotation,
+			"base_free": base_balances.free,
+			"base_locked_in_orders": base_balances.lockedInOrders,
+			"base_unsettled": base_balances.unsettled,
+			"base_total": base_balances.total,
+			"quote_token_symbol": self._quote_token.symbol,
+			"quote_quotation": quote_balances.quotation,
+			"quote_free": quote_balances.free,
+			"quote_locked_in_orders": quote_balances.lockedInOrders,
+			"quote_unsettled": quote_balances.unsettled,
+			"quote_total": quote_balances.total,
+			"wallet_initial_value": wallet.initial_value,
+			"wallet_previous_value": wallet.previous_value,
+			"wallet_current_value": wallet.current_value,
+			"wallet_current_initial_pnl": format_percentage(wallet.current_initial_pnl, 3),
+			"wallet_current_previous_pnl": format_percentage(wallet.current_previous_pnl, 3),
+			"base_initial_price": base_token_prices.initial_price,
+			"base_previous_price": base_token_prices.previous_price,
+			"base_current_price": base_token_prices.current_price,
+			"base_current_initial_pnl": format_percentage(base_token_prices.current_initial_pnl, 3),
+			"base_current_previous_pnl": format_percentage(base_token_prices.current_previous_pnl, 3),
+			"used_price": prices.used_price,
+			"ticker_price": prices.ticker_price,
+			"new_orders_quantity": len(state_orders.new),
+			"canceled_orders_quantity": len(state_orders.canceled),
+			"native_token_symbol": gas_payed.token.symbol,
+			"token_creation": gas_payed_token_amounts.creation,
+			"token_cancellation": gas_payed_token_amounts.cancellation,
+			"token_withdrawing_native": gas_payed_token_amounts.withdrawing.native,
+			"token_withdrawing_base": gas_payed_token_amounts.withdrawing.base,
+			"token_withdrawing_quote": gas_payed_token_amounts.withdrawing.quote,
+			"token_total": gas_payed_token_amounts.total,
+			"usd_creation": gas_payed_usd_amounts.creation,
+			"usd_cancellation": gas_payed_usd_amounts.cancellation,
+			"usd_withdrawing_base": gas_payed_usd_amounts.withdrawing.base,
+			"usd_withdrawing_quote": gas_payed_usd_amounts.withdrawing.quote,
+			"usd_withdrawing_total": gas_payed_usd_amounts.withdrawing.total,
+			"usd_total": gas_payed_usd_amounts.total,
+		})]
 
 		if new_orders_summary:
-			summary += f"""\n<b> New:</b>\n{new_orders_summary}"""
+			summary_parts.append(f"""\n<b> New:</b>\n{new_orders_summary}""")
 
 		if untracked_orders_summary:
-			summary += f"""\n<b> Untracked:</b>\n{untracked_orders_summary}"""
+			summary_parts.append(f"""\n<b> Untracked:</b>\n{untracked_orders_summary}""")
 
 		if canceled_orders_summary:
-			summary += f"""\n<b> Canceled:</b>\n{canceled_orders_summary}"""
+			summary_parts.append(f"""\n<b> Canceled:</b>\n{canceled_orders_summary}""")
 
 		if filled_orders_summary:
-			summary += f"""\n<b> Filled:</b>\n{filled_orders_summary}"""
-
-		summary += textwrap.dedent(
-			f"""\n\n\
-				<b>Settings</b>:
-				 TickInterval: {self._configuration.strategy.tick_interval}
-				 OrderType: {self._order_type.name}
-				 PriceStrategy: {self._price_strategy.name}
-				 MiddlePriceStrategy: {self._middle_price_strategy.name}\
-			"""
-		)
+			summary_parts.append(f"""\n<b> Filled:</b>\n{filled_orders_summary}""")
+
+		summary_parts.append(SETTINGS_SUMMARY_TEMPLATE.format_map({
+			"tick_interval": self._configuration.strategy.tick_interval,
+			"order_type": self._order_type.name,
+			"price_strategy": self._price_strategy.name,
+			"middle_price_strategy": self._middle_price_strategy.name,
+		}))
 
-		return summary
+		return "".join(summary_parts)
 	
 	def _hot_reload(self):
 		import importlib
@@ -1515,20 +1611,27 @@ class Worker(WorkerBase):
 			self.log(DEBUG, f"""end""")
 
 	def _get_untracked_orders_ids(self, open_orders_ids: List[str], orders_to_cancel_ids: List[str]):
-		currently_untracked_orders_ids = list(
-			set(
-				set(self._all_tracked_orders_ids).intersection(set(open_orders_ids))
-				- set(self._currently_tracked_orders_ids)
-			).union(orders_to_cancel_ids)
-		)
+		all_tracked_orders_ids = self._all_tracked_orders_ids
+		currently_tracked_orders_ids = self._currently_tracked_orders_ids
 
-		return currently_untracked_orders_ids
+		currently_untracked_orders_ids = {
+			order_id for order_id in open_orders_ids
+			if order_id in all_tracked_orders_ids and order_id not in currently_tracked_orders_ids
+		}
+		currently_untracked_orders_ids.update(orders_to_cancel_ids)
+
+		return list(currently_untracked_orders_ids)
 
 	def _get_untracked_orders(self, open_orders: DotMap[str, Any]):
 		open_orders_ids = list(open_orders.keys())
 
 		currently_untracked_orders_ids = self._get_untracked_orders_ids(open_orders_ids, [])
 
+		# Orders that are neither open nor currently tracked can never be reported as untracked again.
+		self._all_tracked_orders_ids.intersection_update(
+			self._currently_tracked_orders_ids.union(open_orders_ids)
+		)
+
 		currently_untracked_orders = DotMap({}, _dynamic=False)
 
 		if len(currently_untracked_orders_ids) > 0:
@@ -1647,10 +1750,10 @@ class Worker(WorkerBase):
 					self.state = DotMap(json.loads(content, object_hook=handle_deserialization), _dynamic=False)
 
 	def _print_summary_and_save_state(self):
+		self._save_state()
+
 		summary = self._get_summary()
 
 		if summary:
-			self._save_state()
-
 			self.log(INFO, summary)
 			self.telegram_log(INFO, summary)
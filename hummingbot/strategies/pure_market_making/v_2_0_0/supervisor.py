@@ -81,11 +81,11 @@ class Supervisor(StrategyBase):
 
 		with open(os.path.join(base_path, f"{self.CATEGORY}.yml"), 'r') as stream:
 			target = yaml.safe_load(stream) or {}
-			configuration = deep_merge(copy.deepcopy(configuration), target)
+			configuration = deep_merge(configuration, target)
 
 		with open(os.path.join(base_path, "common.yml"), 'r') as stream:
 			target = yaml.safe_load(stream) or {}
-			configuration = deep_merge(copy.deepcopy(configuration), target)
+			configuration = deep_merge(configuration, target)
 
 		with open(os.path.join(base_path, "workers", "common.yml"), 'r') as stream:
 			configuration_worker_common = yaml.safe_load(stream) or {}
@@ -98,7 +98,7 @@ class Supervisor(StrategyBase):
 				target = yaml.safe_load(stream) or {}
 				configuration_worker = deep_merge(copy.deepcopy(configuration_worker_common), target)
 
-				configuration["workers"][worker_id] = copy.deepcopy(configuration_worker)
+				configuration["workers"][worker_id] = configuration_worker
 
 		self._configuration = DotMap(configuration, _dynamic=False)
 
@@ -1,5 +1,4 @@
 import asyncio
-import copy
 import json
 import os
 import textwrap
@@ -17,7 +16,7 @@ from core.properties import properties
 from core.types import SystemStatus
 from core.utils import dump, deep_merge
 from hummingbot.constants import DECIMAL_NAN, DEFAULT_PRECISION, alignment_column, DECIMAL_INFINITY
-from hummingbot.constants import KUJIRA_NATIVE_TOKEN, DECIMAL_ZERO, FLOAT_ZERO, FLOAT_INFINITY
+from hummingbot.constants import KUJIRA_NATIVE_TOKEN, DECIMAL_ZERO
 from hummingbot.hummingbot_gateway import HummingbotGateway
 from hummingbot.strategies.worker_base import WorkerBase as MainWorkerBase
 from hummingbot.types import OrderStatus, OrderType, OrderSide, PriceStrategy, MiddlePriceStrategy, Order
@@ -93,15 +92,15 @@ class WorkerBase(MainWorkerBase):
 
 		with open(os.path.join(base_path, "common.yml"), 'r') as stream:
 			target = yaml.safe_load(stream) or {}
-			configuration = deep_merge(copy.deepcopy(configuration), target)
+			configuration = deep_merge(configuration, target)
 
 		with open(os.path.join(base_path, "workers", "common.yml"), 'r') as stream:
 			target = yaml.safe_load(stream) or {}
-			configuration = deep_merge(copy.deepcopy(configuration), target)
+			configuration = deep_merge(configuration, target)
 
 		with open(os.path.join(base_path, "workers", f"{self._client_id}.yml"), 'r') as stream:
 			target = yaml.safe_load(stream) or {}
-			configuration = deep_merge(copy.deepcopy(configuration), target)
+			configuration = deep_merge(configuration, target)
 
 		self._configuration = DotMap(configuration, _dynamic=False)
 
@@ -358,8 +357,9 @@ class WorkerBase(MainWorkerBase):
 			minimum_price_increment = Decimal(self._market.minimumPriceIncrement)
 			minimum_order_size = Decimal(self._market.minimumOrderSize)
 
-			best_bid_price = Decimal(next(iter(bids), {"price": FLOAT_ZERO}).price)
-			best_ask_price = Decimal(next(iter(asks), {"price": FLOAT_INFINITY}).price)
+			# An empty book side falls back to the used price, so no order is anchored to zero or infinity.
+			best_bid_price = Decimal(str(bids[0][0])) if bids else self._used_price
+			best_ask_price = Decimal(str(asks[0][0])) if asks else self._used_price
 
 			client_id = 1
 			proposal = []
@@ -394,7 +394,9 @@ class WorkerBase(MainWorkerBase):
 				if bid_size.is_nan() or (not (bid_size > 0)):
 					continue
 
-				if bid_price < minimum_price_increment:
+				if not bid_price.is_finite():
+					self.log(WARNING, f"""Skipping orders placement from layer {index}, invalid bid price:\n\n{'{:^30}'.format(str(bid_price))}""")
+				elif bid_price < minimum_price_increment:
 					self.log(WARNING, f"""Skipping orders placement from layer {index}, bid price too low:\n\n{'{:^30}'.format(round(bid_price, 6))}""")
 				elif bid_size < minimum_order_size:
 					self.log(WARNING, f"""Skipping orders placement from layer {index}, bid size too low:\n\n{'{:^30}'.format(round(bid_size, 9))}""")
@@ -443,7 +445,9 @@ class WorkerBase(MainWorkerBase):
 				if ask_size.is_nan() or (not (ask_size > 0)):
 					continue
 
-				if ask_price < minimum_price_increment:
+				if not ask_price.is_finite():
+					self.log(WARNING, f"""Skipping orders placement from layer {index}, invalid ask price:\n\n{'{:^30}'.format(str(ask_price))}""", True)
+				elif ask_price < minimum_price_increment:
 					self.log(WARNING, f"""Skipping orders placement from layer {index}, ask price too low:\n\n{'{:^30}'.format(round(ask_price, 9))}""", True)
 				elif ask_size < minimum_order_size:
 					self.log(WARNING, f"""Skipping orders placement from layer {index}, ask size too low:\n\n{'{:^30}'.format(round(ask_size, 9))}""", True)
@@ -727,7 +731,7 @@ class WorkerBase(MainWorkerBase):
 				else:
 					response = await HummingbotGateway.kujira_get_balances(request)
 
-					self._balances = DotMap(copy.deepcopy(response), _dynamic=False)
+					self._balances = DotMap(response, _dynamic=False)
 
 					self._balances.total.free = Decimal(self._balances.total.free)
 					self._balances.total.lockedInOrders = Decimal(self._balances.total.lockedInOrders)
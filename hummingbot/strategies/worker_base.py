@@ -1,3 +1,4 @@
+from hummingbot.constants import NANOSECONDS_IN_A_SECOND
 from hummingbot.strategies.base import Base
 
 
@@ -17,3 +18,11 @@ class WorkerBase(Base):
 			result = number
 
 		return result
+
+	def _calculate_next_refresh_timestamp(self, interval: float) -> float:
+		interval_in_nanoseconds = int(interval * NANOSECONDS_IN_A_SECOND)
+		current_timestamp_in_nanoseconds = self.clock.now_in_nanoseconds()
+
+		result = current_timestamp_in_nanoseconds - (current_timestamp_in_nanoseconds % interval_in_nanoseconds) + interval_in_nanoseconds
+
+		return result / NANOSECONDS_IN_A_SECOND
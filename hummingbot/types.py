@@ -1,6 +1,7 @@
 import asyncio
 import json
 from _decimal import Decimal
+from dataclasses import dataclass, fields
 from enum import Enum
 from typing import Optional, Any, Dict
 
@@ -88,26 +89,24 @@ class MiddlePriceStrategy(Enum):
 	VWAP = 'VOLUME_WEIGHTED_AVERAGE_PRICE'
 
 
+@dataclass(slots=True, eq=False)
 class Order:
-	def __init__(self) -> None:
-		super().__init__()
-
-	id: Optional[str]
-	client_id: Optional[str]
-	market_name: Optional[str]
-	market_id: Optional[str]
-	market: Optional[Any]
-	owner_address: str
-	payer_address: Optional[str]
-	price: Optional[Decimal]
-	amount: Decimal
-	side: OrderSide
-	status: OrderStatus
-	type: OrderType
-	fee: Decimal
-	creation_timestamp: Optional[int]
-	filling_timestamp: Optional[int]
-	hashes: Optional[Dict[str, str]]
+	id: Optional[str] = None
+	client_id: Optional[str] = None
+	market_name: Optional[str] = None
+	market_id: Optional[str] = None
+	market: Optional[Any] = None
+	owner_address: Optional[str] = None
+	payer_address: Optional[str] = None
+	price: Optional[Decimal] = None
+	amount: Optional[Decimal] = None
+	side: Optional[OrderSide] = None
+	status: Optional[OrderStatus] = None
+	type: Optional[OrderType] = None
+	fee: Optional[Decimal] = None
+	creation_timestamp: Optional[int] = None
+	filling_timestamp: Optional[int] = None
+	hashes: Optional[Dict[str, str]] = None
 
 	def __str__(self):
 		def decoder(target):
@@ -115,7 +114,10 @@ class Order:
 				return str(target)
 			raise TypeError
 
-		dictionary = json.dumps(self.__dict__, default=decoder)
+		dictionary = json.dumps(
+			{field.name: getattr(self, field.name) for field in fields(self) if getattr(self, field.name) is not None},
+			default=decoder
+		)
 
 		return dump(dictionary)
 
@@ -1,11 +1,14 @@
 import hashlib
+import heapq
 import math
 import random
 import time
 from _decimal import Decimal
 from array import array
 from datetime import datetime
-from typing import Any, List, Union
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, List, Optional, Tuple, Union
 
 import jsonpickle
 import numpy as np
@@ -19,6 +22,11 @@ def current_timestamp() -> float:
 	return time.time()
 
 
+@lru_cache(maxsize=4096, typed=True)
+def cached_decimal(value: Any) -> Decimal:
+	return Decimal(value)
+
+
 def generate_hash(input: Any) -> str:
 	return generate_hashes([input])[0]
 
@@ -47,47 +55,42 @@ def convert_market_name_to_hb_trading_pair(market_name: str) -> str:
 	return market_name.replace("/", "-")
 
 
-def parse_order_book(orderbook: DotMap[str, Any]) -> List[
-	Union[List[DotMap[str, Any]], List[DotMap[str, Any]]]]:
-	bids_list = []
-	asks_list = []
-
+def parse_order_book(orderbook: DotMap[str, Any], depth: Optional[int] = None) -> List[List[Tuple[float, float]]]:
 	bids: DotMap[str, Any] = orderbook.bids
 	asks: DotMap[str, Any] = orderbook.asks
 
-	for value in bids.values():
-		bids_list.append(DotMap({'price': value.price, 'amount': value.amount}, _dynamic=False))
+	bids_list = [(float(value.price), float(value.amount)) for value in bids.values()]
+	asks_list = [(float(value.price), float(value.amount)) for value in asks.values()]
 
-	for value in asks.values():
-		asks_list.append(DotMap({'price': value.price, 'amount': value.amount}, _dynamic=False))
-
-	bids_list.sort(key=lambda x: x['price'], reverse=True)
-	asks_list.sort(key=lambda x: x['price'], reverse=False)
+	if depth is None:
+		bids_list.sort(key=itemgetter(0), reverse=True)
+		asks_list.sort(key=itemgetter(0), reverse=False)
+	else:
+		# Only the top of the book is needed, so a partial selection avoids sorting all levels.
+		bids_list = heapq.nlargest(depth, bids_list, key=itemgetter(0))
+		asks_list = heapq.nsmallest(depth, asks_list, key=itemgetter(0))
 
 	return [bids_list, asks_list]
 
 
-def split_percentage(bids: [DotMap[str, Any]], asks: [DotMap[str, Any]]) -> List[Any]:
+def split_percentage(bids: List[Tuple[float, float]], asks: List[Tuple[float, float]]) -> List[Any]:
 	asks = asks[:math.ceil((VWAP_THRESHOLD / 100) * len(asks))]
 	bids = bids[:math.ceil((VWAP_THRESHOLD / 100) * len(bids))]
 
 	return [bids, asks]
 
 
-def compute_volume_weighted_average_price(book: [DotMap[str, Any]]) -> np.array:
-	prices = [float(order['price']) for order in book]
-	amounts = [float(order['amount']) for order in book]
+def compute_volume_weighted_average_price(book: Union[List[Tuple[float, float]], np.ndarray]) -> float:
+	book = np.asarray(book, dtype=np.float64)
+	prices = book[:, 0]
+	amounts = book[:, 1]
 
-	prices = np.array(prices)
-	amounts = np.array(amounts)
+	return float(np.dot(prices, amounts) / amounts.sum())
 
-	vwap = (np.cumsum(amounts * prices) / np.cumsum(amounts))
 
-	return vwap
-
-
-def remove_outliers(order_book: [DotMap[str, Any]], side: OrderSide) -> [DotMap[str, Any]]:
-	prices = [order['price'] for order in order_book]
+def remove_outliers(order_book: Union[List[Tuple[float, float]], np.ndarray], side: OrderSide) -> np.ndarray:
+	order_book = np.asarray(order_book, dtype=np.float64)
+	prices = order_book[:, 0]
 
 	q75, q25 = np.percentile(prices, [75, 25])
 
@@ -99,52 +102,29 @@ def remove_outliers(order_book: [DotMap[str, Any]], side: OrderSide) -> [DotMap[
 	max_threshold = q75 * 1.5
 	min_threshold = q25 * 0.5
 
-	orders = []
+	orders = order_book[:0]
 	if side == OrderSide.SELL:
-		orders = [order for order in order_book if order['price'] < max_threshold]
+		orders = order_book[prices < max_threshold]
 	elif side == OrderSide.BUY:
-		orders = [order for order in order_book if order['price'] > min_threshold]
+		orders = order_book[prices > min_threshold]
 
 	return orders
 
 
 def calculate_middle_price(
-	bids: [DotMap[str, Any]],
-	asks: [DotMap[str, Any]],
+	bids: List[Tuple[float, float]],
+	asks: List[Tuple[float, float]],
 	strategy: MiddlePriceStrategy
 ) -> Decimal:
+	# The order book sides are expected to be sorted with the best prices first (see parse_order_book).
 	if strategy == MiddlePriceStrategy.SAP:
-		bid_prices = [float(item['price']) for item in bids]
-		ask_prices = [float(item['price']) for item in asks]
-
-		best_ask_price = 0
-		best_bid_price = 0
-
-		if len(ask_prices) > 0:
-			best_ask_price = min(ask_prices)
-
-		if len(bid_prices) > 0:
-			best_bid_price = max(bid_prices)
+		best_ask_price = asks[0][0] if len(asks) > 0 else 0
+		best_bid_price = bids[0][0] if len(bids) > 0 else 0
 
 		return Decimal((best_ask_price + best_bid_price) / 2.0)
 	elif strategy == MiddlePriceStrategy.WAP:
-		bid_prices = [float(item['price']) for item in bids]
-		ask_prices = [float(item['price']) for item in asks]
-
-		best_ask_price = 0
-		best_ask_volume = 0
-		best_bid_price = 0
-		best_bid_amount = 0
-
-		if len(ask_prices) > 0:
-			best_ask_idx = ask_prices.index(min(ask_prices))
-			best_ask_price = float(asks[best_ask_idx]['price'])
-			best_ask_volume = float(asks[best_ask_idx]['amount'])
-
-		if len(bid_prices) > 0:
-			best_bid_idx = bid_prices.index(max(bid_prices))
-			best_bid_price = float(bids[best_bid_idx]['price'])
-			best_bid_amount = float(bids[best_bid_idx]['amount'])
+		(best_ask_price, best_ask_volume) = asks[0] if len(asks) > 0 else (0, 0)
+		(best_bid_price, best_bid_amount) = bids[0] if len(bids) > 0 else (0, 0)
 
 		if best_ask_volume + best_bid_amount > 0:
 			return Decimal(
@@ -162,12 +142,10 @@ def calculate_middle_price(
 		if len(asks) > 0:
 			asks = remove_outliers(asks, OrderSide.SELL)
 
-		book = [*bids, *asks]
+		book = np.concatenate((np.reshape(bids, (-1, 2)), np.reshape(asks, (-1, 2))))
 
 		if len(book) > 0:
-			vwap = compute_volume_weighted_average_price(book)
-
-			return Decimal(vwap[-1])
+			return Decimal(compute_volume_weighted_average_price(book))
 		else:
 			return DECIMAL_ZERO
 	else:
@@ -185,6 +163,15 @@ def format_line(left, right, column=alignment_column, align: str = "right"):
 		raise ValueError(f"""Align option "{align}" not recognized.""")
 
 
+def format_line_template(left: str, field: str, number_format: Optional[str] = None, column=alignment_column) -> str:
+	width = alignment_column + column - len(left)
+
+	if number_format:
+		return f"""<code>{left}{{{field}:> {width}{number_format}}}</code>"""
+	else:
+		return f"""<code>{left} {{{field}:>{width - 1}}}</code>"""
+
+
 def format_currency(target: Decimal, precision: int) -> str:
 	return ("{:0,." + str(precision) + "f}").format(round(target, precision))
 